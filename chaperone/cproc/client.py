@@ -15,23 +15,24 @@ class CommandClient(asyncio.Protocol):
         self.message = message
         self.loop = loop
         self.result = None
+        self._data = list()
 
     def connection_made(self, transport):
         transport.write(self.message.encode())
 
     def data_received(self, data):
-        msg = data.decode()
+        # Large results (such as timelines) may arrive in several pieces, so we collect them
+        # until the connection closes.
+        self._data.append(data)
+
+    def connection_lost(self, exc):
+        self.loop.stop()
+
+        msg = b''.join(self._data).decode()
         lines = msg.split("\n")
-        error = None
 
         if lines[0] in {'COMMAND-ERROR', 'RESULT'}:
             self.result = "\n".join(lines[1:])
         else:
-            error = "Unexpected response from chaperone: " + str(msg)
-
-        if error:
-            raise Exception(error)
-
-    def connection_lost(self, exc):
-        self.loop.stop()
+            self.result = "Unexpected response from chaperone: " + str(msg)
 
@@ -2,6 +2,7 @@ import os
 import asyncio
 import stat
 import shlex
+import json
 from functools import partial
 from docopt import docopt
 
@@ -19,6 +20,7 @@ Usage: telchap status
        telchap enable [<servname> ...]
        telchap disable [<servname> ...]
        telchap dependencies
+       telchap timeline [--json]
        telchap shutdown [<delay>]
 """
 
@@ -73,9 +75,22 @@ class dependenciesCommand(_BaseCommand):
 
     @asyncio.coroutine
     def do_exec(self, opts, controller):
-        graph = controller.services.services_config.get_dependency_graph()
+        serv = controller.services
+        graph = serv.services_config.get_dependency_graph(serv.get_durations())
         return "\n".join(graph)
 
+class timelineCommand(_BaseCommand):
+
+    command_name = "timeline"
+    interactive_only = True
+
+    @asyncio.coroutine
+    def do_exec(self, opts, controller):
+        serv = controller.services
+        if opts['--json']:
+            return json.dumps(serv.get_chrome_trace())
+        return str(serv.get_timeline_formatter().get_formatted_data())
+
 class serviceReset(_BaseCommand):
 
     command_name = 'reset'
@@ -190,6 +205,7 @@ COMMANDS = (
     serviceEnable(),
     serviceDisable(),
     dependenciesCommand(),
+    timelineCommand(),
 )
 
 class CommandProtocol(ServerProtocol):
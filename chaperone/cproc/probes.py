@@ -0,0 +1,147 @@
+import os
+import asyncio
+import shlex
+
+from chaperone.cutil.errors import ChParameterError
+from chaperone.cutil.misc import executable_path
+
+# Probes are polled starting at PROBE_MIN_INTERVAL, and the interval doubles after each failed
+# attempt until it reaches PROBE_MAX_INTERVAL.  Services which are ready quickly are detected
+# within a few milliseconds, while slow services are not polled excessively.
+
+PROBE_MIN_INTERVAL = 0.005
+PROBE_MAX_INTERVAL = 0.5
+
+PROBE_CONNECT_TIMEOUT = 1.0     # maximum time allowed for a single connection attempt
+PROBE_EXEC_TIMEOUT = 5.0        # maximum time allowed for a single probe command to run
+
+
+class ReadinessProbe(object):
+    """
+    Base class for readiness probes.  A probe is specified with a 'ready_probe' service directive
+    in one of the following forms:
+
+       tcp:port, tcp:host:port     Ready when a TCP connection can be established.
+       unix:/path/to/socket        Ready when a connection can be made to the unix domain socket.
+       file:/path/to/file          Ready when the file exists.
+       exec:command args ...       Ready when the command exits with a zero exit status.
+    """
+
+    kind = None
+    spec = None
+
+    _cls_kinds = dict()
+
+    @classmethod
+    def register(cls, probecls):
+        cls._cls_kinds[probecls.kind] = probecls
+        return probecls
+
+    @classmethod
+    def create(cls, spec, process):
+        kind, sep, arg = spec.partition(':')
+        probecls = cls._cls_kinds.get(kind.strip().lower())
+        if not sep or not probecls or not arg.strip():
+            raise ChParameterError("invalid ready_probe specification for {0}: '{1}'".format(process.name, spec))
+        return probecls(arg.strip(), process, spec)
+
+    def __init__(self, arg, process, spec):
+        self.process = process
+        self.spec = spec
+        self.parse(arg)
+
+    def parse(self, arg):
+        pass
+
+    def __str__(self):
+        return self.spec
+
+    @asyncio.coroutine
+    def check(self):
+        "Returns True if the service is ready."
+        return False
+
+
+@ReadinessProbe.register
+class FileProbe(ReadinessProbe):
+
+    kind = 'file'
+
+    def parse(self, arg):
+        self.path = arg
+
+    @asyncio.coroutine
+    def check(self):
+        return os.path.exists(self.path)
+
+
+@ReadinessProbe.register
+class TCPProbe(ReadinessProbe):
+
+    kind = 'tcp'
+
+    def parse(self, arg):
+        host, sep, port = arg.rpartition(':')
+        try:
+            self.port = int(port)
+        except ValueError:
+            raise ChParameterError("invalid port number in ready_probe for {0}: '{1}'".format(self.process.name, self.spec))
+        self.host = host.strip('[]') or 'localhost'
+
+    def _connect(self):
+        return asyncio.get_event_loop().create_connection(asyncio.Protocol, self.host, self.port)
+
+    @asyncio.coroutine
+    def check(self):
+        try:
+            (transport, protocol) = yield from asyncio.wait_for(self._connect(), PROBE_CONNECT_TIMEOUT)
+        except (OSError, asyncio.TimeoutError):
+            return False
+        transport.close()
+        return True
+
+
+@ReadinessProbe.register
+class UnixProbe(TCPProbe):
+
+    kind = 'unix'
+
+    def parse(self, arg):
+        self.path = arg
+
+    def _connect(self):
+        return asyncio.get_event_loop().create_unix_connection(asyncio.Protocol, self.path)
+
+
+@ReadinessProbe.register
+class ExecProbe(ReadinessProbe):
+
+    kind = 'exec'
+
+    def parse(self, arg):
+        self.args = shlex.split(arg)
+
+    @asyncio.coroutine
+    def check(self):
+        process = self.process
+        env = process.service.environment.expanded()
+        try:
+            args = [executable_path(self.args[0], env)] + self.args[1:]
+            proc = yield from asyncio.create_subprocess_exec(*args,
+                                                             preexec_fn=process._setup_subprocess,
+                                                             env=env.get_public_environment(),
+                                                             stdin=asyncio.subprocess.DEVNULL,
+                                                             stdout=asyncio.subprocess.DEVNULL,
+                                                             stderr=asyncio.subprocess.DEVNULL)
+        except OSError as ex:
+            process.logdebug("{0} ready_probe '{1}' could not be executed: {2}", process.name, self.spec, ex)
+            return False
+
+        try:
+            result = yield from asyncio.wait_for(proc.wait(), PROBE_EXEC_TIMEOUT)
+        except asyncio.TimeoutError:
+            proc.kill()
+            yield from proc.wait()
+            return False
+
+        return result == 0
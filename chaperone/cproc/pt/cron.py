@@ -52,13 +52,17 @@ class CronProcess(SubProcess):
             return
 
         self.start_attempted = True
+        self.timeline.mark('queued')
 
         # Start up cron
         try:
             self._cron.start()
         except Exception:
+            self.timeline.mark('failed')
             raise ChParameterError("not a valid cron interval specification, '{0}'".format(self.interval))
 
+        self.timeline.mark('ready')
+
         self.loginfo("cron service {0} scheduled using interval spec '{1}'".format(self.name, self.interval))
 
     @asyncio.coroutine
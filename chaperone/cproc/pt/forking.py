@@ -15,6 +15,7 @@ class ForkingProcess(SubProcess):
             else:
                 raise ChProcessError("{0} failed on start-up with result '{1}'".format(self.name, result), resultcode = result)
         yield from self.wait_for_pidfile()
+        yield from self.wait_until_ready()
         
     def _exit_timeout(self):
         service = self.service
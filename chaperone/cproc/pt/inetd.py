@@ -124,8 +124,10 @@ class InetdProcess(SubProcess):
         Takes over process startup and sets up our own server socket.
         """
         
+        self.timeline.mark('exec')
         self.server = InetdService(self)
         yield from self.server.run()
+        self.timeline.mark('started')
 
         self.loginfo("inetd service {0} listening on port {1}".format(self.name, self.port))
 
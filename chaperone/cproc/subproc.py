@@ -16,6 +16,9 @@ from chaperone.cutil.proc import ProcStatus
 from chaperone.cutil.misc import lazydict, lookup_user, get_signal_name, executable_path
 from chaperone.cutil.errors import ChNotFoundError, ChProcessError, ChParameterError
 from chaperone.cutil.format import TableFormatter
+from chaperone.cutil.inotify import FileWatcher
+from chaperone.cutil.timeline import ServiceTimeline, get_timeline_formatter, get_chrome_trace, get_durations
+from chaperone.cproc.probes import ReadinessProbe, PROBE_MIN_INTERVAL, PROBE_MAX_INTERVAL
 
 @asyncio.coroutine
 def _process_logger(stream, kind, service):
@@ -67,6 +70,8 @@ class SubProcess(object):
 
     _pending = None             # pending futures
     _note = None
+    _timeline = None            # start-up milestones (see cutil/timeline.py)
+    _probe = None               # readiness probe, if the service defines one
 
     # Class variables
     _cls_ptdict = lazydict()    # dictionary of process types
@@ -98,6 +103,7 @@ class SubProcess(object):
         self.family = family
 
         self._pending = set()
+        self._timeline = ServiceTimeline(service.name)
 
         if service.process_timeout is not None:
             self.process_timeout = service.process_timeout
@@ -116,6 +122,9 @@ class SubProcess(object):
 
         self._orig_executable = service.exec_args[0]
 
+        if service.ready_probe:
+            self._probe = ReadinessProbe.create(service.ready_probe, self)
+
         if service.enabled:
             self._try_to_enable()
 
@@ -209,6 +218,10 @@ class SubProcess(object):
     def note(self, value):
         self._note = value
 
+    @property
+    def timeline(self):
+        return self._timeline
+
     @property
     def status(self):
         serv = self.service
@@ -391,6 +404,7 @@ class SubProcess(object):
         # Now we can procede
 
         self.start_attempted = True
+        self._timeline.mark('queued')
 
         try:
 
@@ -399,6 +413,7 @@ class SubProcess(object):
                 for p in prereq:
                     yield from p.start()
                 self.logdebug("service {0} prerequisites satisfied", service.name)
+            self._timeline.mark('prereqs')
 
             if self.family:
                 # idle only makes sense for families
@@ -414,12 +429,15 @@ class SubProcess(object):
             try:
                 yield from self.start_subprocess()
             except Exception as ex:
+                self._timeline.mark('failed')
                 if service.ignore_failures:
                     self.loginfo("service {0} ignoring failures. Exception: {1}", service.name, ex)
                 else:
                     self._cond_exception = ex
                     self.logdebug("{0} received exception during attempted start. Exception: {1}", service.name, ex)
                     raise
+            else:
+                self._timeline.mark('ready')
 
         finally:
             self._started = True
@@ -473,7 +491,9 @@ class SubProcess(object):
             self.logwarn("system will be killed when '{0}' exits", service.exec_args[0])
             yield from asyncio.sleep(0.2)
 
+        self._timeline.mark('exec')
         proc = self._proc = yield from create
+        self._timeline.mark('started')
 
         self.pid = proc.pid
 
@@ -503,6 +523,9 @@ class SubProcess(object):
         If the pidfile option was specified, then wait until we find a valid pidfile,
         and register the new PID.  This is not done automatically, but is implemented
         here as a utility for process types that need it.
+
+        Where possible, we use inotify to watch the directory containing the pidfile so that
+        it is noticed immediately.  Otherwise (or if the directory does not yet exist), we poll.
         """
         if not self.pidfile:
             return
@@ -513,25 +536,45 @@ class SubProcess(object):
         minsleep = 3
         expires = time() + self.process_timeout
         last_ex = None
+        watcher = None
 
-        while time() < expires:
-            if not self.family.system_alive:
-                return
-            yield from asyncio.sleep(pidsleep)
-            # ramp up until we hit the minsleep ceiling
-            pidsleep = min(pidsleep*2, minsleep)
-            try:
-                newpid = int(open(self.pidfile, 'r').read().strip())
-            except FileNotFoundError:
-                continue
-            except Exception as ex:
-                # Don't raise this immediately.  The service may create the file before writing the PID.
-                last_ex = ChProcessError("{0} found pid file '{1}' but contents did not contain an integer".format(
-                                         self.name, self.pidfile), errno = errno.EINVAL)
-                continue
+        try:
+            while True:
+                if not self.family.system_alive:
+                    return
 
-            self.pid = newpid
-            return
+                if not watcher:
+                    try:
+                        watcher = FileWatcher(self.pidfile)
+                    except OSError:
+                        pass
+
+                try:
+                    newpid = int(open(self.pidfile, 'r').read().strip())
+                except FileNotFoundError:
+                    pass
+                except Exception as ex:
+                    # Don't raise this immediately.  The service may create the file before writing the PID.
+                    last_ex = ChProcessError("{0} found pid file '{1}' but contents did not contain an integer".format(
+                                             self.name, self.pidfile), errno = errno.EINVAL)
+                else:
+                    self.pid = newpid
+                    return
+
+                remaining = expires - time()
+                if remaining <= 0:
+                    break
+
+                if watcher:
+                    # Polling is only a safety net in case a change notification is missed.
+                    yield from watcher.wait(min(remaining, minsleep))
+                else:
+                    yield from asyncio.sleep(min(pidsleep, remaining))
+                    # ramp up until we hit the minsleep ceiling
+                    pidsleep = min(pidsleep*2, minsleep)
+        finally:
+            if watcher:
+                watcher.close()
 
         if last_ex is not None:
             raise last_ex
@@ -611,6 +654,7 @@ class SubProcess(object):
             yield from self.reset()
             return
 
+        self._timeline.mark('failed')
         self.logerror("{0} terminated abnormally with {1}", service.name, code)
 
     def _restart_callback(self, fut):
@@ -706,8 +750,14 @@ class SubProcess(object):
         """
         Wait a short time just to see if the process errors out immediately.  This avoids a retry loop
         and catches any immediate failures now.  Can be used by process implementations if needed.
+
+        If the service has a readiness probe, then we wait for the probe to succeed instead.
         """
 
+        if self._probe:
+            yield from self.wait_until_ready()
+            return
+
         if not self.startup_pause:
             return
 
@@ -722,6 +772,55 @@ class SubProcess(object):
                 raise ChProcessError("{0} failed on start-up with result '{1}'".format(self.name, result),
                                      resultcode = result)
 
+    @asyncio.coroutine
+    def wait_until_ready(self):
+        """
+        Polls the readiness probe (if any) until it succeeds, the process fails, or process_timeout
+        expires.  Polling starts quickly, then backs off so that slow services are not polled
+        excessively.
+        """
+        probe = self._probe
+
+        if not probe:
+            return
+
+        self.logdebug("{0} waiting for ready_probe '{1}'", self.name, probe)
+
+        interval = PROBE_MIN_INTERVAL
+        expires = time() + self.process_timeout
+
+        while True:
+            if self.family and not self.family.system_alive:
+                return
+
+            result = self.returncode
+            if result is not None and not result.normal_exit:
+                if self.ignore_failures:
+                    warn("{0} (ignored) failure on start-up with result '{1}'".format(self.name, result))
+                    return
+                raise ChProcessError("{0} failed on start-up with result '{1}'".format(self.name, result),
+                                     resultcode = result)
+
+            ready = yield from probe.check()
+            if ready:
+                self.logdebug("{0} ready_probe '{1}' succeeded", self.name, probe)
+                return
+
+            if time() >= expires:
+                break
+
+            yield from asyncio.sleep(min(interval, max(expires - time(), 0)))
+            interval = min(interval * 2, PROBE_MAX_INTERVAL)
+
+        message = "{0} ready_probe '{1}' did not succeed after {2} second(s)".format(self.name, probe, self.process_timeout)
+
+        if self.ignore_failures:
+            warn("{0} (ignored)", message)
+            return
+
+        self.terminate()
+        raise ChProcessError(message, errno = errno.ETIMEDOUT)
+
     @asyncio.coroutine
     def timed_wait(self, timeout, func = None):
         """
@@ -788,6 +887,16 @@ class SubProcessFamily(lazydict):
         df = TableFormatter('pid', 'name', 'enabled', 'status', 'note', sort='name')
         df.add_rows(self.values())
         return df
+
+    def get_timeline_formatter(self):
+        return get_timeline_formatter([s.timeline for s in self.values()])
+
+    def get_chrome_trace(self):
+        return get_chrome_trace([s.timeline for s in self.values()])
+
+    def get_durations(self):
+        "Returns the measured start-up durations of each service, for those which have completed start-up."
+        return get_durations([s.timeline for s in self.values()])
     
     @property
     def system_alive(self):
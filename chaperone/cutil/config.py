@@ -39,6 +39,7 @@ _config_schema = V.Any(
         'port': V.Any(str, int),
         'pidfile': str,
         'process_timeout': V.Any(float, int),
+        'ready_probe': str,
         'startup_pause': V.Any(float, int),
         'restart': bool,
         'restart_limit': int,
@@ -225,6 +226,7 @@ class ServiceConfig(_BaseConfig):
     pidfile = None              # the pidfile to monitor
     port = None                 # used for inetd processes
     process_timeout = None      # time to elapse before we decide a process has misbehaved
+    ready_probe = None          # probe which determines when the service is ready (see cproc/probes.py)
     startup_pause = 0.5         # time to wait momentarily to see if a service starts (if needed)
     restart = False
     restart_limit = 5           # number of times to invoke a restart before giving up
@@ -243,7 +245,8 @@ class ServiceConfig(_BaseConfig):
     prerequisites = None        # a list of service names which are prerequisites to this one
 
     _repr_pat = "Service:{0.name}(service_groups={0.service_groups}, after={0.after}, before={0.before})"
-    _expand_these = {'command', 'stdout', 'stderr', 'interval', 'directory', 'exec_args', 'pidfile', 'enabled', 'port'}
+    _expand_these = {'command', 'stdout', 'stderr', 'interval', 'directory', 'exec_args', 'pidfile', 'enabled', 'port',
+                     'ready_probe'}
     _typecheck = {'enabled': 'assure_bool', 'port': 'assure_int'}
     _assure_bool = {'enabled'}
     _settings_defaults = {'debug', 'idle_delay', 'process_timeout', 'startup_pause', 'ignore_failures'}
@@ -330,12 +333,15 @@ class ServiceDict(lazydict):
         super().clear()
         self._ordered_startup = None
 
-    def get_dependency_graph(self):
+    def get_dependency_graph(self, durations = None):
         """
         Returns a set of dependency groups.  Each group represents a set of dependencies starting at the
         root of the dependency tree.  This is valuable for debugging dependencies.   The output graph
         is ascii-art which shows the earliest start times and latest stop times for each service,
         roughly in order of start-up.
+
+        If 'durations' is provided, it is a dictionary of service names and measured start-up times
+        (in seconds) which will be shown alongside each service's histogram.
         """
 
         sep = ' | '
@@ -359,8 +365,15 @@ class ServiceDict(lazydict):
 
         lines.append(' ' * (maxwidth + len(sep)) + sep.join(s.shortname for s in sulist))
 
-        for s in sulist:
-            lines.append(s.shortname.ljust(maxwidth) + sep + histogram(s))
+        if durations:
+            hwidth = max(s._column for s in sulist) + 1
+            for s in sulist:
+                dur = durations.get(s.name)
+                lines.append(s.shortname.ljust(maxwidth) + sep + histogram(s).ljust(hwidth) +
+                             ("  {0:.3f}s".format(dur) if dur is not None else "  -"))
+        else:
+            for s in sulist:
+                lines.append(s.shortname.ljust(maxwidth) + sep + histogram(s))
 
         lines.append(('-' * (maxwidth)) + '-> depends on...')
 
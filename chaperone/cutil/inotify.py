@@ -0,0 +1,105 @@
+import os
+import struct
+import asyncio
+import ctypes
+import ctypes.util
+
+# Linux inotify support using ctypes, since there is no such support in the standard library.
+# If inotify is not available, then creating a watcher will raise OSError, and callers are
+# expected to fall back to polling.
+
+IN_MODIFY       = 0x00000002
+IN_CLOSE_WRITE  = 0x00000008
+IN_MOVED_TO     = 0x00000080
+IN_CREATE       = 0x00000100
+
+IN_CLOEXEC      = 0o2000000
+IN_NONBLOCK     = 0o0004000
+
+_EVENT_HEADER = struct.Struct('iIII')     # wd, mask, cookie, len
+
+_libc = None
+
+def _get_libc():
+    global _libc
+
+    if _libc is None:
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            libc.inotify_init1
+            libc.inotify_add_watch
+        except (OSError, AttributeError):
+            libc = False
+        _libc = libc
+
+    if not _libc:
+        raise OSError("inotify is not available on this system")
+
+    return _libc
+
+
+class FileWatcher(object):
+    """
+    Watches a single directory entry for creation or modification.  The directory itself
+    must exist.  Use wait() to wait until the file appears or changes.
+    """
+
+    _fd = None
+    _event = None
+    _loop = None
+
+    def __init__(self, filename, mask = IN_CREATE | IN_MOVED_TO | IN_CLOSE_WRITE | IN_MODIFY):
+        libc = _get_libc()
+
+        path = os.path.abspath(filename)
+        self.directory = os.path.dirname(path)
+        self.name = os.fsencode(os.path.basename(path))
+
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        if libc.inotify_add_watch(fd, os.fsencode(self.directory), mask) < 0:
+            err = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(err, os.strerror(err), self.directory)
+
+        self._fd = fd
+        self._event = asyncio.Event()
+        self._loop = asyncio.get_event_loop()
+        self._loop.add_reader(fd, self._read_events)
+
+    def _read_events(self):
+        try:
+            data = os.read(self._fd, 8192)
+        except BlockingIOError:
+            return
+
+        pos = 0
+        while pos + _EVENT_HEADER.size <= len(data):
+            (wd, mask, cookie, namelen) = _EVENT_HEADER.unpack_from(data, pos)
+            pos += _EVENT_HEADER.size
+            name = data[pos:pos+namelen].rstrip(b'\0')
+            pos += namelen
+            if name == self.name:
+                self._event.set()
+
+    @asyncio.coroutine
+    def wait(self, timeout = None):
+        """
+        Waits until the file is created or changed, or until the timeout expires.  Returns True
+        if a change was seen.
+        """
+        try:
+            yield from asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._event.clear()
+        return True
+
+    def close(self):
+        if self._fd is not None:
+            self._loop.remove_reader(self._fd)
+            os.close(self._fd)
+            self._fd = None
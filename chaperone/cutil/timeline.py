@@ -0,0 +1,136 @@
+from time import time
+
+from chaperone.cutil.format import TableFormatter
+
+# Start-up milestones, in the order they normally occur.  Each service records the time at which
+# it reached each milestone during its most recent start attempt.
+
+TIMELINE_EVENTS = ('queued', 'prereqs', 'exec', 'started', 'ready', 'failed')
+
+# Each phase spans the time between two milestones, and is what appears as a "slice" in
+# a Chrome trace.
+
+_PHASES = (
+    ('waiting for prerequisites', 'queued',  'prereqs'),
+    ('preparing',                 'prereqs', 'exec'),
+    ('spawning',                  'exec',    'started'),
+    ('starting',                  'started', ('ready', 'failed')),
+)
+
+
+class ServiceTimeline(object):
+    """
+    Keeps track of when a service reached each of its start-up milestones.  A new 'queued' mark
+    begins a new start attempt and discards the marks of any prior attempt.
+    """
+
+    __slots__ = ('name', 'marks')
+
+    def __init__(self, name):
+        self.name = name
+        self.marks = dict()
+
+    def mark(self, event, when = None):
+        if event == 'queued':
+            self.marks.clear()
+        self.marks[event] = when if when is not None else time()
+
+    def get(self, event):
+        return self.marks.get(event)
+
+    @property
+    def first(self):
+        return self.marks.get('queued') or (self.marks and min(self.marks.values())) or None
+
+    @property
+    def last(self):
+        return self.marks.get('ready') or self.marks.get('failed')
+
+    @property
+    def duration(self):
+        "Time from queueing until the service was ready (or failed), or None if not yet known."
+        first = self.first
+        last = self.last
+        if first is None or last is None:
+            return None
+        return last - first
+
+    def _phase_end(self, end):
+        if isinstance(end, tuple):
+            for e in end:
+                if e in self.marks:
+                    return self.marks[e]
+            return None
+        return self.marks.get(end)
+
+    def phases(self):
+        "Yields (phase_name, start, end) for each phase which has both endpoints."
+        for (name, start, end) in _PHASES:
+            t0 = self.marks.get(start)
+            t1 = self._phase_end(end)
+            if t0 is not None and t1 is not None:
+                yield (name, t0, t1)
+
+
+def _origin(timelines):
+    firsts = [t.first for t in timelines if t.first is not None]
+    return min(firsts) if firsts else time()
+
+def get_durations(timelines):
+    "Returns a dictionary of service name to measured start-up duration (in seconds)."
+    return {t.name: t.duration for t in timelines if t.duration is not None}
+
+def get_timeline_formatter(timelines):
+    """
+    Returns a TableFormatter which shows each milestone as an offset (in seconds) from the
+    earliest recorded milestone of any service.
+    """
+    origin = _origin(timelines)
+
+    class _row:
+        def __init__(self, tl):
+            self.name = tl.name
+            for e in TIMELINE_EVENTS:
+                val = tl.get(e)
+                setattr(self, e, val is not None and "{0:.3f}".format(val - origin) or None)
+            dur = tl.duration
+            self.total = dur is not None and "{0:.3f}".format(dur) or None
+            self._first = tl.first if tl.first is not None else float('inf')
+
+    rows = sorted((_row(t) for t in timelines), key=lambda r: (r._first, r.name))
+
+    df = TableFormatter('name', *(TIMELINE_EVENTS + ('total',)))
+    df.add_rows(rows)
+    return df
+
+def get_chrome_trace(timelines, pid = 1, other = None):
+    """
+    Returns a dictionary in Chrome's trace-event format (load the JSON into chrome://tracing
+    or Perfetto).  Each service is a separate thread, and each start-up phase is a complete ("X")
+    event.  Failures appear as instant events.
+    """
+    origin = _origin(timelines)
+    events = list()
+
+    usec = lambda t: int((t - origin) * 1000000)
+
+    ordered = sorted(timelines, key=lambda t: (t.first if t.first is not None else float('inf'), t.name))
+
+    for tid, tl in enumerate(ordered, 1):
+        events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                       'args': {'name': tl.name}})
+        events.append({'name': 'thread_sort_index', 'ph': 'M', 'pid': pid, 'tid': tid,
+                       'args': {'sort_index': tid}})
+        for (name, t0, t1) in tl.phases():
+            events.append({'name': name, 'cat': 'service', 'ph': 'X', 'pid': pid, 'tid': tid,
+                           'ts': usec(t0), 'dur': usec(t1) - usec(t0),
+                           'args': {'service': tl.name}})
+        failed = tl.get('failed')
+        if failed is not None:
+            events.append({'name': 'failed', 'cat': 'service', 'ph': 'i', 's': 't', 'pid': pid, 'tid': tid,
+                           'ts': usec(failed), 'args': {'service': tl.name}})
+
+    other_data = dict(other or ())
+    other_data['durations'] = get_durations(timelines)
+
+    return {'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': other_data}
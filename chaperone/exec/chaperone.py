@@ -6,7 +6,7 @@ Usage:
               [--user=<name> | --create-user=<newuser>] [--default-home=<dir>]
               [--exitkills | --no-exitkills] [--ignore-failures] [--log-level=<level>] [--no-console-log]
               [--debug] [--force] [--disable-services] [--no-defaults] [--no-syslog]
-              [--version] [--show-dependencies]
+              [--version] [--show-dependencies [--timings=<file>]]
               [--task]
               [<command> [<args> ...]]
 
@@ -29,6 +29,8 @@ Options:
                              daemon is started later).
     --user=<name>            Start first process as user (else root)
     --show-dependencies      Shows a list of service dependencies then exits
+    --timings=<file>         With --show-dependencies, shows start-up durations measured in a trace
+                             file created with 'telchap timeline --json'.
     --task                   Run in task mode (see below).
     --version                Display version and exit
 
@@ -52,6 +54,7 @@ import os
 import re
 import asyncio
 import subprocess
+import json
 
 from functools import partial
 from docopt import docopt
@@ -170,7 +173,15 @@ def main_entry():
       exit(1)
 
    if options['--show-dependencies']:
-      dg = services.get_dependency_graph()
+      durations = None
+      if options['--timings']:
+         try:
+            with open(options['--timings'], 'r') as f:
+               durations = json.load(f)['otherData']['durations']
+         except Exception as ex:
+            print("Could not read start-up timings from {0}: {1}".format(options['--timings'], ex))
+            exit(1)
+      dg = services.get_dependency_graph(durations)
       print("\n".join(dg))
       exit(0)
 
@@ -6,5 +6,6 @@ python3 env_parse.py
 python3 events.py
 python3 service_order.py
 python3 syslog_spec.py
+python3 timeline.py
 
 ./run-el.sh
@@ -0,0 +1,49 @@
+from prefix import *
+
+from chaperone.cutil.timeline import ServiceTimeline, get_chrome_trace, get_durations, get_timeline_formatter
+
+def make_timeline(name, start, **offsets):
+    tl = ServiceTimeline(name)
+    tl.mark('queued', start)
+    for k,v in offsets.items():
+        tl.mark(k, start + v)
+    return tl
+
+class TestTimeline(unittest.TestCase):
+
+    def setUp(self):
+        self.tl1 = make_timeline('one.service', 100.0, prereqs=0.0, exec=0.01, started=0.02, ready=0.52)
+        self.tl2 = make_timeline('two.service', 100.0, prereqs=0.52, exec=0.53, started=0.54, failed=0.60)
+        self.tl3 = make_timeline('three.service', 101.0)
+
+    def test_durations(self):
+        d = get_durations([self.tl1, self.tl2, self.tl3])
+        self.assertEqual(sorted(d.keys()), ['one.service', 'two.service'])
+        self.assertAlmostEqual(d['one.service'], 0.52)
+        self.assertAlmostEqual(d['two.service'], 0.60)
+
+    def test_requeue(self):
+        tl = make_timeline('x.service', 5.0, ready=1.0)
+        tl.mark('queued', 10.0)
+        self.assertIsNone(tl.duration)
+        self.assertIsNone(tl.get('ready'))
+
+    def test_chrome_trace(self):
+        trace = get_chrome_trace([self.tl3, self.tl2, self.tl1])
+        events = trace['traceEvents']
+        slices = [e for e in events if e['ph'] == 'X']
+        self.assertEqual(len(slices), 8)
+        self.assertTrue(all(e['ts'] >= 0 and e['dur'] >= 0 for e in slices))
+        names = {e['tid']: e['args']['name'] for e in events if e['name'] == 'thread_name'}
+        self.assertEqual(names[3], 'three.service')
+        self.assertEqual(len([e for e in events if e['ph'] == 'i']), 1)
+        self.assertIn('durations', trace['otherData'])
+
+    def test_formatter(self):
+        text = get_timeline_formatter([self.tl1, self.tl2]).get_formatted_data()
+        lines = text.split("\n")
+        self.assertTrue(lines[0].startswith('name'))
+        self.assertTrue(lines[2].startswith('one.service'))
+
+if __name__ == '__main__':
+    unittest.main()